@@ -19,11 +19,15 @@ from biar.model import (
 )
 from biar.services import (
     get_ssl_context,
+    get_ssl_context_async,
+    install_uvloop,
     is_host_reachable,
     poll,
     request,
     request_many,
+    request_stream,
     request_structured,
+    request_structured_iter,
     request_structured_many,
 )
 
@@ -41,15 +45,19 @@ __all__ = [
     "Retryer",
     "StructuredResponse",
     "get_ssl_context",
+    "get_ssl_context_async",
     "is_host_reachable",
     "request",
     "request_structured",
     "request_structured_many",
+    "request_structured_iter",
     "ResponseEvaluationError",
     "request_many",
+    "request_stream",
     "poll",
     "PollConfig",
     "PollError",
     "ContentCallbackError",
     "Payload",
+    "install_uvloop",
 ]
@@ -0,0 +1,37 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """In memory token bucket.
+
+    Tokens are refilled continuously at `rate` tokens per second, up to `capacity`.
+    Each acquisition takes one token. When the bucket is empty, the token is reserved
+    ahead and the caller sleeps until it is refilled, so concurrent callers queue up
+    without the need of a lock.
+
+    Attributes:
+        rate: number of tokens refilled per second.
+        capacity: maximum number of tokens, i.e. the maximum burst size.
+        tokens: number of tokens currently available.
+            A negative number means tokens already reserved by waiting callers.
+        last: monotonic timestamp of the last refill.
+
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "last")
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Take one token, waiting for it to be refilled if needed."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
@@ -1,17 +1,39 @@
 import asyncio
-from functools import cached_property
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type
+import random
+from functools import cached_property, partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import aiohttp
-import tenacity
 from aiohttp import ClientResponseError
-from loguru import logger
-from pydantic import BaseModel, ConfigDict, Field, JsonValue, computed_field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    JsonValue,
+    PositiveInt,
+    computed_field,
+)
 from pyrate_limiter import Duration, InMemoryBucket, Limiter, Rate
 from yarl import URL
 
+from biar._tokenbucket import TokenBucket
 from biar.errors import ContentCallbackError, ResponseEvaluationError
 
+ModelT = TypeVar("ModelT", bound="_CachedModel")
+
 
 class ProxyConfig(BaseModel):
     """Proxy configuration.
@@ -35,7 +57,8 @@ class Response(BaseModel):
         url: final url after (possible) redirects.
         status_code: HTTP status code.
         headers: headers in the response.
-        json_content: response content as json dict.
+        json_content: response content as json.
+            None if the json content was not downloaded or the body was empty.
         text_content: raw response content as a string.
         bytes_content: raw response content as bytes.
 
@@ -46,7 +69,7 @@ class Response(BaseModel):
     url: URL
     status_code: int
     headers: Dict[str, Any] = Field(default_factory=dict)
-    json_content: Dict[str, JsonValue] = Field(default_factory=dict)
+    json_content: JsonValue = None
     text_content: str = ""
     bytes_content: bytes = b""
 
@@ -58,7 +81,8 @@ class StructuredResponse(Response):
         url: final url after (possible) redirects.
         status_code: HTTP status code.
         headers: headers in the response.
-        json_content: response content as json dict.
+        json_content: response content as json.
+            None if the json content was not downloaded or the body was empty.
         text_content: raw response content as a string.
         bytes_content: raw response content as bytes.
         structured_content: response content as a pydantic model.
@@ -68,14 +92,50 @@ class StructuredResponse(Response):
     structured_content: Any
 
 
-class Retryer(BaseModel):
-    """Retry logic with exponential backoff strategy.
+class _CachedModel(BaseModel):
+    """Base model for models with cached properties derived from their fields.
+
+    Cached values are dropped whenever a field is set or the model is copied with
+    updates. Mutating a field in place, like a dict, does not drop them, so only
+    values derived from immutable fields should be cached.
+
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field, dropping values cached from the previous fields."""
+        super().__setattr__(name, value)
+        self._clear_cached_properties()
+
+    def model_copy(
+        self: ModelT, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> ModelT:
+        """Copy the model, dropping values cached from the previous fields."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._clear_cached_properties()
+        return copied
+
+    def _clear_cached_properties(self) -> None:
+        for cls in type(self).__mro__:
+            for name, attribute in vars(cls).items():
+                if isinstance(attribute, cached_property):
+                    self.__dict__.pop(name, None)
+
+
+class Retryer(_CachedModel):
+    """Retry logic with fixed or exponential backoff strategy.
 
     Attributes:
         attempts: number of attempts.
             `attempts=1` means only one try and no subsequent retry attempts.
         min_delay: number of seconds as the starting delay.
         max_delay: number of seconds as the maximum achieving delay.
+        backoff: how the delay changes between attempts.
+            "exponential" doubles the delay after each attempt, "fixed" always waits
+            `min_delay` seconds.
+        jitter: if true, each delay is randomized between 50% and 150% of its
+            value (never above `max_delay`), so clients failing at the same time
+            do not retry all at once.
         retry_if_exception_in: retry if exception found in this tuple.
             A ResponseEvaluationError is always added dynamically to be retried.
 
@@ -84,6 +144,8 @@ class Retryer(BaseModel):
     attempts: int = 1
     min_delay: int = 0
     max_delay: int = 10
+    backoff: Literal["fixed", "exponential"] = "exponential"
+    jitter: bool = True
     retry_if_exception_in: Tuple[Type[BaseException], ...] = (
         ClientResponseError,
         asyncio.TimeoutError,
@@ -91,40 +153,54 @@ class Retryer(BaseModel):
     )
     retry_based_on_content_callback: Optional[Callable[[BaseModel], bool]] = None
 
-    @property
-    def retrying_config(self) -> Dict[str, Any]:
-        """Configuration for retrying logic.
+    @cached_property
+    def retry_exceptions(self) -> Tuple[Type[BaseException], ...]:
+        """Exceptions to be retried, including ResponseEvaluationError."""
+        return self.retry_if_exception_in + (ResponseEvaluationError,)
+
+    def get_delay(self, attempt: int) -> float:
+        """Number of seconds to wait before the next attempt.
 
-        Changing arguments at run time reference:
-        https://github.com/jd/tenacity#changing-arguments-at-run-time
+        With exponential backoff, the delay grows exponentially with the attempt
+        number and is bounded by `min_delay` and `max_delay`.
+
+        Args:
+            attempt: number of the attempt that just failed, starting at 1.
 
         Returns:
-            kwargs dictionary for tenacity.BaseRetrying.
+            delay in seconds.
 
         """
-        return dict(
-            stop=tenacity.stop_after_attempt(self.attempts),
-            retry=tenacity.retry_if_exception_type(
-                exception_types=self.retry_if_exception_in + (ResponseEvaluationError,)
-            ),
-            wait=tenacity.wait_exponential(min=self.min_delay, max=self.max_delay),
-            reraise=True,
-            before_sleep=tenacity.before_sleep_log(
-                logger=logger, log_level="DEBUG"  # type: ignore[arg-type]
-            ),
-        )
+        if self.backoff == "fixed":
+            delay = float(self.min_delay)
+        else:
+            delay = float(max(self.min_delay, min(2 ** (attempt - 1), self.max_delay)))
+        if self.jitter:
+            delay = min(delay * random.uniform(0.5, 1.5), self.max_delay)
+        return delay
 
 
 class RateLimiter(BaseModel):
     """Limit the number of requests in a given time frame.
 
     Attributes:
-        rate: number of requests allowed in the given time frame.
+        rate: number of requests allowed in the given time frame, on average.
+            With the default "token_bucket" strategy, a full bucket lets up to
+            `capacity + rate` requests through in the first time frame. Use
+            "sliding_window" when the API enforces a hard quota per time frame.
         time_frame: number of seconds for the time frame.
         identity: identification for the rate-limiting bucket.
             Same identity can be used universally for all endpoints in a given host, if
             the API have a global limit. If the API have different limits for each
             endpoint, different identities can be used as well.
+            The same rate limiter instance can be given to many request configs to
+            share its limit between them.
+        strategy: rate limiting algorithm.
+            "token_bucket" refills `rate / time_frame` requests per second and allows
+            bursts of up to `capacity` requests. "sliding_window" guarantees that no
+            more than `rate` requests are made in any window of `time_frame` seconds.
+        capacity: maximum burst size for the "token_bucket" strategy.
+            By default, it is the same as `rate`.
 
     """
 
@@ -133,11 +209,17 @@ class RateLimiter(BaseModel):
     rate: int = 10
     time_frame: int = 1
     identity: str = "default"
+    strategy: Literal["token_bucket", "sliding_window"] = "token_bucket"
+    capacity: Optional[int] = None
 
     @computed_field  # type: ignore[prop-decorator]
     @cached_property
-    def limiter(self) -> Limiter:
+    def limiter(self) -> Union[TokenBucket, Limiter]:
         """In memory bucket to limit the number of requests."""
+        if self.strategy == "token_bucket":
+            return TokenBucket(
+                rate=self.rate / self.time_frame, capacity=self.capacity or self.rate
+            )
         return Limiter(
             InMemoryBucket(
                 rates=[
@@ -151,12 +233,28 @@ class RateLimiter(BaseModel):
             max_delay=Duration.MINUTE.value,
         )
 
+    async def acquire(self) -> None:
+        """Wait until a new request is allowed.
+
+        The sliding window limiter sleeps synchronously while waiting, so it runs in
+        the default executor to keep the event loop free for other requests.
+
+        """
+        if isinstance(self.limiter, TokenBucket):
+            await self.limiter.acquire()
+        else:
+            await asyncio.get_running_loop().run_in_executor(
+                None, partial(self.limiter.try_acquire, self.identity)
+            )
 
-class RequestConfig(BaseModel):
+
+class RequestConfig(_CachedModel):
     """Base configuration for a request.
 
     Attributes:
         method: http method to be used.
+            Use "HEAD" with all the download flags disabled to probe only the
+            status and headers, the body is never downloaded in this case.
         download_json_content: if true will await for json content download.
         download_text_content: if true will await for text content download.
         download_bytes_content: if true will await for bytes content download.
@@ -165,6 +263,9 @@ class RequestConfig(BaseModel):
         retryer: retry logic configuration.
         timeout: maximum number of seconds for timeout.
             By default, is 300 seconds (5 minutes).
+        connect_timeout: maximum number of seconds to acquire a connection,
+            including the time waiting for a free connection in the pool.
+            By default, it is only bounded by `timeout`.
         use_random_user_agent: if true will use a random user agent.
         user_agent_list: list of user agents to be randomly selected.
             By default, it uses a sample from `biar.user_agents` module.
@@ -174,15 +275,23 @@ class RequestConfig(BaseModel):
         session: aiohttp session to be used in request.
             If the user wants to use a custom session and handle its lifecycle, it can
             be passed here.
-        acceptable_codes: list of acceptable status codes.
-            If the response status code is not in this list, an exception will be
+        acceptable_codes: set of acceptable status codes (lists are converted).
+            If the response status code is not in this set, an exception will be
             raised. By default, it only accepts 200.
+        max_concurrency: maximum number of requests in flight at the same time when
+            making many requests, 64 by default. It must be positive, None means no
+            limit.
+        pool_size: maximum number of open connections in the shared session pool.
+            Requests beyond this limit wait for a free connection.
+        pool_size_per_host: maximum number of open connections to the same host in
+            the shared session pool. By default, 0 means no per host limit.
+            Both pool sizes are ignored when a custom `session` is given.
 
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    method: Literal["GET", "POST", "PUT", "DELETE"] = "GET"
+    method: Literal["GET", "POST", "PUT", "DELETE", "HEAD"] = "GET"
     download_json_content: bool = True
     download_text_content: bool = True
     download_bytes_content: bool = False
@@ -190,13 +299,40 @@ class RequestConfig(BaseModel):
     rate_limiter: RateLimiter = RateLimiter()
     retryer: Retryer = Retryer()
     timeout: int = 300
+    connect_timeout: Optional[int] = None
     use_random_user_agent: bool = True
     user_agent_list: Optional[List[str]] = None
     bearer_token: Optional[str] = None
     headers: Optional[Dict[str, str]] = None
     params: Optional[Dict[str, Any]] = None
     session: Optional[aiohttp.ClientSession] = None
-    acceptable_codes: Optional[List[int]] = None
+    acceptable_codes: Optional[FrozenSet[int]] = None
+    max_concurrency: Optional[PositiveInt] = 64
+    pool_size: int = 100
+    pool_size_per_host: int = 0
+
+    @cached_property
+    def _static_request_kwargs(self) -> Dict[str, Any]:
+        """Request kwargs that are the same for every request using this config.
+
+        Headers and params are mutable, so they are read from the config on every
+        request, together with per request values like the random User-Agent and the
+        payload.
+
+        """
+        return {
+            "method": self.method,
+            "timeout": aiohttp.ClientTimeout(
+                total=self.timeout, connect=self.connect_timeout
+            ),
+        }
+
+    @cached_property
+    def _authorization_header(self) -> Optional[str]:
+        """Authorization header value built from the bearer token, if any."""
+        if self.bearer_token:
+            return f"Bearer {self.bearer_token}"
+        return None
 
 
 class PollConfig(BaseModel):
@@ -1,12 +1,32 @@
 import asyncio
-import datetime
+import concurrent.futures
+import contextlib
+import functools
 import ssl
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+import sys
+import time
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import aiodns
 import aiohttp
 import certifi
-import tenacity
+import orjson
 from loguru import logger
 from pydantic import BaseModel
 from yarl import URL
@@ -20,14 +40,51 @@ from biar import (
     RequestConfig,
     Response,
     ResponseEvaluationError,
+    Retryer,
     StructuredResponse,
 )
 from biar.user_agents import get_user_agent
 
+T = TypeVar("T")
+
+_DEFAULT_ACCEPTABLE_CODES = frozenset({200})
+
+
+_DNS_CACHE_SIZE = 1024
+_DNS_CACHE_TTL = 60.0
+_dns_cache: Dict[str, Tuple[float, bool]] = {}
+_dns_resolver: Optional[aiodns.DNSResolver] = None
+
+
+def _get_dns_resolver() -> aiodns.DNSResolver:
+    # a resolver is bound to the loop that created it, so it is replaced when called
+    # from another loop, which also releases the previous one
+    global _dns_resolver
+    loop = asyncio.get_running_loop()
+    if _dns_resolver is None or _dns_resolver.loop is not loop:
+        _dns_resolver = aiodns.DNSResolver(loop=loop)
+    return _dns_resolver
+
+
+def _cache_reachability(host: str, checked_at: float, reachable: bool) -> None:
+    # entries are kept in check order, so the expired ones are always the oldest
+    _dns_cache.pop(host, None)
+    while _dns_cache:
+        oldest_host = next(iter(_dns_cache))
+        if checked_at - _dns_cache[oldest_host][0] < _DNS_CACHE_TTL:
+            break
+        del _dns_cache[oldest_host]
+    if len(_dns_cache) >= _DNS_CACHE_SIZE:
+        _dns_cache.pop(next(iter(_dns_cache)))
+    _dns_cache[host] = (checked_at, reachable)
+
 
 async def is_host_reachable(host: str) -> bool:
     """Async check if a host is reachable.
 
+    The resolver is reused by all calls in the same event loop, and results are
+    cached for 60 seconds, for up to 1024 hosts.
+
     Args:
         host: url to check if is reachable.
 
@@ -35,12 +92,43 @@ async def is_host_reachable(host: str) -> bool:
         True if the host is reachable.
 
     """
-    dns_solver = aiodns.DNSResolver()
+    now = time.monotonic()
+    cached = _dns_cache.get(host)
+    if cached and now - cached[0] < _DNS_CACHE_TTL:
+        return cached[1]
     try:
-        _ = await dns_solver.query(host, qtype="A")
-        return True
+        _ = await _get_dns_resolver().query(host, qtype="A")
+        reachable = True
     except aiodns.error.DNSError:
-        return False
+        reachable = False
+    _cache_reachability(host=host, checked_at=now, reachable=reachable)
+    return reachable
+
+
+_SSL_CONTEXTS_CACHE_SIZE = 32
+_ssl_contexts: Dict[Optional[str], ssl.SSLContext] = {}
+# ssl contexts are built in their own thread, so they never wait behind blocking
+# calls in the default executor, like the sliding window rate limiter
+_ssl_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="biar-ssl"
+)
+
+
+def _build_ssl_context(extra_certificate: Optional[str]) -> ssl.SSLContext:
+    context = ssl.create_default_context(cafile=certifi.where())
+    if extra_certificate:
+        context.load_verify_locations(cadata=extra_certificate)
+    return context
+
+
+def _cache_ssl_context(
+    extra_certificate: Optional[str], context: ssl.SSLContext
+) -> ssl.SSLContext:
+    if extra_certificate not in _ssl_contexts:
+        if len(_ssl_contexts) >= _SSL_CONTEXTS_CACHE_SIZE:
+            _ssl_contexts.pop(next(iter(_ssl_contexts)))
+        _ssl_contexts[extra_certificate] = context
+    return _ssl_contexts[extra_certificate]
 
 
 def get_ssl_context(extra_certificate: Optional[str] = None) -> ssl.SSLContext:
@@ -49,18 +137,111 @@ def get_ssl_context(extra_certificate: Optional[str] = None) -> ssl.SSLContext:
     It uses the collection of certificates provided by certifi package. Besides, the
     user can give an additional certificate to be appended to the final collection.
 
+    Contexts are cached by extra certificate, so the same context object is returned
+    for repeated calls and should not be modified by the caller.
+
     Args:
         extra_certificate: extra string certificate to be used alongside default ones.
 
     Returns:
-        new ssl context.
+        ssl context.
 
     """
-    with open(certifi.where()) as f:
-        certificate = f.read()
-    if extra_certificate:
-        certificate = certificate + "\n" + extra_certificate
-    return ssl.create_default_context(cadata=certificate)
+    context = _ssl_contexts.get(extra_certificate)
+    if context is None:
+        context = _cache_ssl_context(
+            extra_certificate, _build_ssl_context(extra_certificate=extra_certificate)
+        )
+    return context
+
+
+async def get_ssl_context_async(
+    extra_certificate: Optional[str] = None,
+) -> ssl.SSLContext:
+    """Create a ssl context without blocking the event loop.
+
+    Same as `get_ssl_context`, but contexts not cached yet are built in a dedicated
+    thread, as loading the certificates takes tens of milliseconds.
+
+    Args:
+        extra_certificate: extra string certificate to be used alongside default ones.
+
+    Returns:
+        ssl context.
+
+    """
+    context = _ssl_contexts.get(extra_certificate)
+    if context is None:
+        context = _cache_ssl_context(
+            extra_certificate,
+            await asyncio.get_running_loop().run_in_executor(
+                _ssl_executor, _build_ssl_context, extra_certificate
+            ),
+        )
+    return context
+
+
+def install_uvloop() -> bool:
+    """Use uvloop as the asyncio event loop implementation, if available.
+
+    uvloop is an optional dependency, installed with `pip install biar[uvloop]`.
+    It is not supported on Windows, where the default asyncio loop is kept. Call it
+    once, before starting the event loop (e.g. before `asyncio.run`).
+
+    Returns:
+        True if uvloop was installed as the event loop policy, False otherwise.
+
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.warning("uvloop is not available, using the default asyncio loop.")
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def _new_session(config: RequestConfig) -> aiohttp.ClientSession:
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=config.pool_size,
+            limit_per_host=config.pool_size_per_host,
+            ttl_dns_cache=300,
+        ),
+    )
+
+
+def _session_context(
+    config: RequestConfig,
+) -> AsyncContextManager[aiohttp.ClientSession]:
+    if config.session:
+        return contextlib.nullcontext(config.session)
+    return _new_session(config=config)
+
+
+@contextlib.asynccontextmanager
+async def _shared_session(config: RequestConfig) -> AsyncIterator[RequestConfig]:
+    """Yield a config whose session is shared by all the requests in a batch.
+
+    If the user already provided a session, the config is yielded untouched and the
+    session lifecycle is left to the user.
+
+    """
+    if config.session:
+        yield config
+        return
+    async with _new_session(config=config) as session:
+        yield config.model_copy(update=dict(session=session))
+
+
+async def _evaluate_status(
+    response: aiohttp.ClientResponse, acceptable_codes: Optional[FrozenSet[int]]
+) -> None:
+    if response.status not in (acceptable_codes or _DEFAULT_ACCEPTABLE_CODES):
+        raise ResponseEvaluationError(
+            f"Error: status={response.status}, "
+            f"Text content: {await response.text(errors='replace')}"
+        )
 
 
 async def _request_base(
@@ -69,32 +250,31 @@ async def _request_base(
     download_bytes_content: bool,
     rate_limiter: RateLimiter,
     session: aiohttp.ClientSession,
-    acceptable_codes: Optional[List[int]] = None,
+    acceptable_codes: Optional[FrozenSet[int]] = None,
     **request_kwargs: Any,
 ) -> Response:
-    rate_limiter.limiter.try_acquire(name=rate_limiter.identity)
+    await rate_limiter.acquire()
     async with session.request(**request_kwargs) as response:
-        text_content = await response.text() if download_text_content else ""
-        if response.status not in (acceptable_codes or [200]):
-            formated_text_content = text_content.replace("{", "{{").replace("}", "}}")
-            raise ResponseEvaluationError(
-                f"Error: status={response.status}, "
-                f"Text content (if loaded): {formated_text_content}"
-            )
-        bytes_content = await response.read() if download_bytes_content else b""
-        json_content = (
-            await response.json(content_type=None) if download_json_content else None
+        await _evaluate_status(response=response, acceptable_codes=acceptable_codes)
+        raw_content = (
+            await response.read()
+            if download_json_content or download_text_content or download_bytes_content
+            else b""
+        )
+        text_content = (
+            raw_content.decode(response.get_encoding()) if download_text_content else ""
         )
-        normalized_json_content = (
-            json_content
-            if isinstance(json_content, dict)
-            else {"content": json_content}
+        bytes_content = raw_content if download_bytes_content else b""
+        json_content = (
+            orjson.loads(raw_content)
+            if download_json_content and raw_content.strip()
+            else None
         )
-        http_response = Response(
+        http_response = Response.model_construct(
             url=response.url,
             status_code=response.status,
-            headers={k: v for k, v in response.headers.items()},
-            json_content=normalized_json_content,
+            headers=dict(response.headers.items()),
+            json_content=json_content,
             text_content=text_content,
             bytes_content=bytes_content,
         )
@@ -102,75 +282,52 @@ async def _request_base(
     return http_response
 
 
-@tenacity.retry
-async def _request(
-    download_json_content: bool,
-    download_text_content: bool,
-    download_bytes_content: bool,
-    rate_limiter: RateLimiter,
-    session: aiohttp.ClientSession,
-    acceptable_codes: Optional[List[int]] = None,
-    **request_kwargs: Any,
-) -> Response:
-    return await _request_base(
-        download_json_content=download_json_content,
-        download_text_content=download_text_content,
-        download_bytes_content=download_bytes_content,
-        rate_limiter=rate_limiter,
-        session=session,
-        acceptable_codes=acceptable_codes,
-        **request_kwargs,
-    )
+async def _retry(coro_factory: Callable[[], Awaitable[T]], retryer: Retryer) -> T:
+    if retryer.attempts <= 1:
+        return await coro_factory()
+    attempt = 1
+    while True:
+        try:
+            return await coro_factory()
+        except retryer.retry_exceptions as e:
+            if attempt >= retryer.attempts:
+                raise
+            delay = retryer.get_delay(attempt=attempt)
+            logger.debug(
+                f"Retrying in {delay} seconds as it raised {type(e).__name__}: {e}."
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
 
 
-def _build_kwargs(
+async def _build_kwargs(
     url: Union[str, URL],
     config: RequestConfig,
     payload: Optional[Payload] = None,
 ) -> Dict[str, Any]:
-    headers = {
-        **(config.headers or {}),
-        **(
-            {"User-Agent": get_user_agent(user_agent_list=config.user_agent_list)}
-            if config.use_random_user_agent
-            else {}
-        ),
-        **(
-            {"Authorization": f"Bearer {config.bearer_token}"}
-            if config.bearer_token
-            else {}
-        ),
-        **(
-            {"Content-Type": payload.content_type}
-            if payload and payload.content_type
-            else {}
-        ),
-    }
-    proxy_kwargs = (
-        {
-            "proxy": config.proxy_config.host,
-            "proxy_headers": config.proxy_config.headers,
-            "ssl_context": get_ssl_context(
-                extra_certificate=config.proxy_config.ssl_cadata
-            ),
-        }
-        if config.proxy_config
-        else {}
-    )
-    return {
-        "url": url,
-        "method": config.method,
-        "headers": headers,
-        "params": config.params or None,
-        "timeout": config.timeout,
-        "data": payload.any_content if payload and payload.any_content else None,
-        "json": (
-            payload.structured_content.model_dump(mode="json")
-            if payload and payload.structured_content
-            else None
-        ),
-        **proxy_kwargs,
-    }
+    request_kwargs = dict(config._static_request_kwargs)
+    headers = dict(config.headers) if config.headers else {}
+    if config._authorization_header:
+        headers["Authorization"] = config._authorization_header
+    if config.use_random_user_agent:
+        headers["User-Agent"] = get_user_agent(user_agent_list=config.user_agent_list)
+    if payload and payload.content_type:
+        headers["Content-Type"] = payload.content_type
+    request_kwargs["headers"] = headers
+    request_kwargs["params"] = config.params or None
+    if config.proxy_config:
+        request_kwargs["proxy"] = config.proxy_config.host
+        request_kwargs["proxy_headers"] = config.proxy_config.headers
+        request_kwargs["ssl_context"] = await get_ssl_context_async(
+            extra_certificate=config.proxy_config.ssl_cadata
+        )
+    request_kwargs["url"] = url
+    request_kwargs["data"] = None
+    if payload and payload.structured_content:
+        request_kwargs["data"] = payload.structured_content.model_dump_json()
+    elif payload and payload.any_content:
+        request_kwargs["data"] = payload.any_content
+    return request_kwargs
 
 
 async def request(
@@ -190,34 +347,172 @@ async def request(
 
     """
     logger.debug(f"Request started, {config.method} method to {url}...")
-    new_callable = _request.retry_with(**config.retryer.retrying_config)  # type: ignore
-
-    async with aiohttp.ClientSession() as new_session:
-        response: Response = await new_callable(
-            download_json_content=config.download_json_content,
-            download_text_content=config.download_text_content,
-            download_bytes_content=config.download_bytes_content,
-            rate_limiter=config.rate_limiter,
-            session=config.session or new_session,
-            acceptable_codes=config.acceptable_codes,
-            **_build_kwargs(url=url, config=config, payload=payload),
+    async with _session_context(config=config) as session:
+        response = await _retry(
+            coro_factory=functools.partial(
+                _request_base,
+                download_json_content=config.download_json_content,
+                download_text_content=config.download_text_content,
+                download_bytes_content=config.download_bytes_content,
+                rate_limiter=config.rate_limiter,
+                session=session,
+                acceptable_codes=config.acceptable_codes,
+                **await _build_kwargs(url=url, config=config, payload=payload),
+            ),
+            retryer=config.retryer,
         )
 
     logger.debug("Request finished!")
     return response
 
 
+async def _gather_with_concurrency(
+    coroutines: Iterable[Awaitable[T]], max_concurrency: int
+) -> List[T]:
+    # a fixed pool of workers pulls the coroutines one at a time, so only
+    # max_concurrency tasks exist and coroutines are created when they can run
+    pending = enumerate(coroutines)
+    results: Dict[int, T] = {}
+
+    async def _worker() -> None:
+        for index, coroutine in pending:
+            results[index] = await coroutine
+
+    if sys.version_info < (3, 11):  # pragma: no cover
+        await asyncio.gather(*[_worker() for _ in range(max_concurrency)])
+    else:
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for _ in range(max_concurrency):
+                    task_group.create_task(_worker())
+        except BaseExceptionGroup as exception_group:
+            # keep gather's behavior of raising the first error as is
+            raise exception_group.exceptions[0] from None
+    return [results[index] for index in range(len(results))]
+
+
+async def _iter_with_concurrency(
+    coroutines: Iterable[Awaitable[T]], max_concurrency: int
+) -> AsyncIterator[T]:
+    # same worker pool as _gather_with_concurrency, so coroutines are only created
+    # when a worker is free, but each outcome is queued as soon as it completes
+    pending = iter(coroutines)
+    outcomes: "asyncio.Queue[Tuple[bool, Any]]" = asyncio.Queue()
+
+    async def _worker() -> None:
+        try:
+            for coroutine in pending:
+                outcomes.put_nowait((True, await coroutine))
+        except Exception as exception:
+            outcomes.put_nowait((False, exception))
+        finally:
+            # a (False, None) outcome signals that the worker is done
+            outcomes.put_nowait((False, None))
+
+    workers = [asyncio.ensure_future(_worker()) for _ in range(max_concurrency)]
+    running = len(workers)
+    try:
+        while running:
+            succeeded, value = await outcomes.get()
+            if succeeded:
+                yield value
+            elif value is None:
+                running -= 1
+            else:
+                raise value
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def _batch_concurrency(config: RequestConfig, batch_size: int) -> int:
+    if config.max_concurrency is None:
+        return batch_size
+    return min(config.max_concurrency, batch_size)
+
+
 def _normalize_payloads(
     urls: List[Union[str, URL]],
     payloads: Optional[List[Payload]] = None,
-) -> Optional[List[Payload]]:
-    payloads = payloads or []
-    if payloads and len(urls) != len(payloads):
+) -> Sequence[Optional[Payload]]:
+    if not payloads:
+        return [None] * len(urls)
+    if len(urls) != len(payloads):
         raise ValueError(
-            f"Number of urls ({len(urls)}) and payloads ({len(payloads or [])}) "
+            f"Number of urls ({len(urls)}) and payloads ({len(payloads)}) "
             f"must be the same."
         )
-    return payloads
+    return _serialize_payloads(payloads=payloads)
+
+
+def _serialize_payloads(payloads: List[Payload]) -> List[Payload]:
+    # the same payload object sent to many urls is serialized once per batch. The
+    # batch holds a reference to every payload, so their ids can't be reused
+    serialized: Dict[int, Payload] = {}
+    for payload in payloads:
+        if payload.structured_content and id(payload) not in serialized:
+            serialized[id(payload)] = Payload(
+                content_type=payload.content_type,
+                any_content=payload.structured_content.model_dump_json(),
+            )
+    return [serialized.get(id(payload), payload) for payload in payloads]
+
+
+async def _request_many(
+    request_function: Callable[..., Awaitable[T]],
+    urls: List[Union[str, URL]],
+    config: RequestConfig,
+    payloads: Optional[List[Payload]] = None,
+) -> List[T]:
+    normalized_payloads = _normalize_payloads(urls=urls, payloads=payloads)
+    async with _shared_session(config=config) as batch_config:
+        coroutines = (
+            request_function(url=url, config=batch_config, payload=payload)
+            for url, payload in zip(urls, normalized_payloads)
+        )
+        return await _gather_with_concurrency(
+            coroutines=coroutines,
+            max_concurrency=_batch_concurrency(config=config, batch_size=len(urls)),
+        )
+
+
+async def request_stream(
+    url: Union[str, URL],
+    config: RequestConfig = RequestConfig(),
+    payload: Optional[Payload] = None,
+    chunk_size: int = 65536,
+) -> AsyncIterator[bytes]:
+    """Make a request and stream the response content in chunks of bytes.
+
+    The content is yielded as it is received, so memory usage stays constant
+    regardless of the response size, e.g. to write a large file to disk. The
+    download flags are ignored, and the request is not retried, as chunks already
+    yielded can't be taken back.
+
+    Args:
+        url: url to send request.
+        config: request configuration.
+        payload: payload definition for the request.
+        chunk_size: maximum number of bytes in each chunk.
+
+    Yields:
+        Chunks of the response content.
+
+    """
+    logger.debug(f"Request started, {config.method} method to {url}...")
+    await config.rate_limiter.acquire()
+    request_kwargs = await _build_kwargs(url=url, config=config, payload=payload)
+    async with _session_context(config=config) as session, session.request(
+        **request_kwargs
+    ) as response:
+        await _evaluate_status(
+            response=response, acceptable_codes=config.acceptable_codes
+        )
+        async for chunk in response.content.iter_chunked(chunk_size):
+            yield chunk
+
+    logger.debug("Request finished!")
 
 
 async def request_many(
@@ -227,6 +522,8 @@ async def request_many(
 ) -> List[Response]:
     """Make many requests.
 
+    At most `config.max_concurrency` requests are in flight at the same time.
+
     Args:
         urls: list of urls to send requests.
         config: request configuration.
@@ -236,31 +533,11 @@ async def request_many(
         List of response objects from the requests.
 
     """
-    payloads = _normalize_payloads(urls=urls, payloads=payloads)
-    coroutines = (
-        [
-            request(
-                url=url,
-                config=config,
-                payload=payload,
-            )
-            for url, payload in zip(urls, payloads)
-        ]
-        if payloads
-        else [
-            request(
-                url=url,
-                config=config,
-            )
-            for url in urls
-        ]
+    return await _request_many(
+        request_function=request, urls=urls, config=config, payloads=payloads
     )
 
-    results: List[Response] = await asyncio.gather(*coroutines)
-    return results
-
 
-@tenacity.retry
 async def _request_structured(
     model: Type[BaseModel],
     retry_based_on_content_callback: Optional[Callable[[StructuredResponse], bool]],
@@ -269,7 +546,7 @@ async def _request_structured(
     download_bytes_content: bool,
     rate_limiter: RateLimiter,
     session: aiohttp.ClientSession,
-    acceptable_codes: Optional[List[int]] = None,
+    acceptable_codes: Optional[FrozenSet[int]] = None,
     **request_kwargs: Any,
 ) -> StructuredResponse:
     response = await _request_base(
@@ -281,14 +558,9 @@ async def _request_structured(
         acceptable_codes=acceptable_codes,
         **request_kwargs,
     )
-    structured_response = StructuredResponse(
-        url=response.url,
-        status_code=response.status_code,
-        headers=response.headers,
-        json_content=response.json_content,
-        text_content=response.text_content,
-        bytes_content=response.bytes_content,
-        structured_content=model(**response.json_content),
+    structured_response = StructuredResponse.model_construct(
+        **dict(response),
+        structured_content=model.model_validate(response.json_content),
     )
     if retry_based_on_content_callback and retry_based_on_content_callback(
         structured_response.structured_content
@@ -318,25 +590,25 @@ async def request_structured(
         Structured response content deserialized as a pydantic model.
 
     """
-    new_config = config.model_copy(update=dict(download_json_content=True))
-    logger.debug(f"Request started, {new_config.method} method to {url}...")
-
-    rc = new_config.retryer.retrying_config
-    new_callable = _request_structured.retry_with(**rc)  # type: ignore
+    logger.debug(f"Request started, {config.method} method to {url}...")
 
-    async with aiohttp.ClientSession() as new_session:
-        structured_response: StructuredResponse = await new_callable(
-            model=model,
-            retry_based_on_content_callback=(
-                new_config.retryer.retry_based_on_content_callback
+    async with _session_context(config=config) as session:
+        structured_response = await _retry(
+            coro_factory=functools.partial(
+                _request_structured,
+                model=model,
+                retry_based_on_content_callback=(
+                    config.retryer.retry_based_on_content_callback
+                ),
+                download_json_content=True,
+                download_text_content=config.download_text_content,
+                download_bytes_content=config.download_bytes_content,
+                rate_limiter=config.rate_limiter,
+                session=session,
+                acceptable_codes=config.acceptable_codes,
+                **await _build_kwargs(url=url, config=config, payload=payload),
             ),
-            download_json_content=new_config.download_json_content,
-            download_text_content=new_config.download_text_content,
-            download_bytes_content=new_config.download_bytes_content,
-            rate_limiter=new_config.rate_limiter,
-            session=new_config.session or new_session,
-            acceptable_codes=new_config.acceptable_codes,
-            **_build_kwargs(url=url, config=new_config, payload=payload),
+            retryer=config.retryer,
         )
 
     logger.debug("Request finished!")
@@ -351,6 +623,8 @@ async def request_structured_many(
 ) -> List[StructuredResponse]:
     """Make many requests and structure the responses.
 
+    At most `config.max_concurrency` requests are in flight at the same time.
+
     Args:
         model: pydantic model to be used to structure the response.
         urls: list of urls to send requests.
@@ -361,30 +635,50 @@ async def request_structured_many(
         List of structured response content deserialized as a pydantic model.
 
     """
-    payloads = _normalize_payloads(urls=urls, payloads=payloads)
-    coroutines = (
-        [
-            request_structured(
-                model=model,
-                url=url,
-                config=config,
-                payload=payload,
-            )
-            for url, payload in zip(urls, payloads)
-        ]
-        if payloads
-        else [
-            request_structured(
-                model=model,
-                url=url,
-                config=config,
-            )
-            for url in urls
-        ]
+    return await _request_many(
+        request_function=functools.partial(request_structured, model=model),
+        urls=urls,
+        config=config,
+        payloads=payloads,
     )
 
-    results: List[StructuredResponse] = await asyncio.gather(*coroutines)
-    return results
+
+async def request_structured_iter(
+    model: Type[BaseModel],
+    urls: List[Union[str, URL]],
+    config: RequestConfig = RequestConfig(),
+    payloads: Optional[List[Payload]] = None,
+) -> AsyncIterator[StructuredResponse]:
+    """Make many requests and yield the structured responses as they complete.
+
+    Responses are yielded in completion order, not in the order of `urls`, so
+    callers can process each one without waiting for the whole batch. At most
+    `config.max_concurrency` requests are in flight at the same time. Pending
+    requests are cancelled if the iteration is stopped early.
+
+    Args:
+        model: pydantic model to be used to structure the response.
+        urls: list of urls to send requests.
+        config: request configuration.
+        payloads: list of payloads as structured pydantic models.
+
+    Yields:
+        Structured response content deserialized as a pydantic model.
+
+    """
+    normalized_payloads = _normalize_payloads(urls=urls, payloads=payloads)
+    async with _shared_session(config=config) as batch_config:
+        coroutines = (
+            request_structured(
+                model=model, url=url, config=batch_config, payload=payload
+            )
+            for url, payload in zip(urls, normalized_payloads)
+        )
+        async for structured_response in _iter_with_concurrency(
+            coroutines=coroutines,
+            max_concurrency=_batch_concurrency(config=config, batch_size=len(urls)),
+        ):
+            yield structured_response
 
 
 async def poll(
@@ -406,14 +700,14 @@ async def poll(
 
     """
     logger.debug(f"Polling {url}...")
-    start_time = datetime.datetime.now(datetime.UTC)
-    elapsed_time = datetime.timedelta(seconds=0)
-    while elapsed_time.total_seconds() < poll_config.timeout:
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    while loop.time() - start_time < poll_config.timeout:
         response = await request_structured(model=model, url=url, config=config)
         if poll_config.success_condition(response.structured_content):
             logger.debug("Condition met, polling finished!")
             return response
         await asyncio.sleep(poll_config.interval)
-        elapsed_time = datetime.datetime.now(datetime.UTC) - start_time
+        elapsed_time = loop.time() - start_time
         logger.debug(f"Condition not met yet. Elapsed time: {elapsed_time} seconds...")
     raise PollError("Timeout reached")
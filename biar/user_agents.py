@@ -1,7 +1,7 @@
 import random
-from typing import List, Optional
+from typing import Optional, Sequence
 
-USER_AGENTS = [
+USER_AGENTS = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.80 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 12_2) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.80 Safari/537.36",
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.80 Safari/537.36",
@@ -14,10 +14,12 @@ USER_AGENTS = [
     "Mozilla/5.0 (Android 12; Mobile; rv:68.0) Gecko/68.0 Firefox/96.0",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 12_2) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.2 Safari/605.1.15",
     "Mozilla/5.0 (iPhone; CPU iPhone OS 15_3 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.2 Mobile/15E148 Safari/604.1",
-]
+)
 
+_choice = random.choice
 
-def get_user_agent(user_agent_list: Optional[List[str]] = None) -> str:
+
+def get_user_agent(user_agent_list: Optional[Sequence[str]] = None) -> str:
     """Get a random User-Agent.
 
     The list needs to be updated from time to time from this database:
@@ -27,4 +29,4 @@ def get_user_agent(user_agent_list: Optional[List[str]] = None) -> str:
         User-Agent string.
 
     """
-    return random.choice(user_agent_list or USER_AGENTS)
+    return _choice(user_agent_list) if user_agent_list else _choice(USER_AGENTS)
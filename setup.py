@@ -31,4 +31,5 @@ setup(
     long_description_content_type="text/markdown",
     python_requires=">=3.7, <4",
     install_requires=requirements,
+    extras_require={"uvloop": ["uvloop; sys_platform != 'win32'"]},
 )
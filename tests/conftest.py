@@ -0,0 +1,16 @@
+import asyncio
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    # run the tests on uvloop when it is installed, as recommended in production
+    if uvloop:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
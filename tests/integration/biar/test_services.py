@@ -0,0 +1,74 @@
+import pytest
+from aiohttp.test_utils import TestServer
+from pydantic import BaseModel
+
+import biar
+
+
+class MyModel(BaseModel):
+    key: str
+
+
+class TestRealServer:
+    @pytest.mark.asyncio
+    async def test_request_structured_many(self, real_server: TestServer):
+        # arrange
+        urls = [real_server.make_url(f"/entity/{i}") for i in range(20)]
+
+        # act
+        output_responses = await biar.request_structured_many(
+            model=MyModel,
+            urls=urls,
+            config=biar.RequestConfig(rate_limiter=biar.RateLimiter(rate=100)),
+        )
+
+        # assert
+        assert [response.structured_content for response in output_responses] == [
+            MyModel(key=str(i)) for i in range(20)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_request_stream(self, real_server: TestServer):
+        # act
+        chunks = [
+            chunk
+            async for chunk in biar.request_stream(
+                url=real_server.make_url("/entity/1"), chunk_size=4
+            )
+        ]
+
+        # assert
+        assert b"".join(chunks) == b'{"key": "1"}'
+        assert max(len(chunk) for chunk in chunks) <= 4
+
+    @pytest.mark.asyncio
+    async def test_request_many_retry(self, real_server: TestServer):
+        # arrange
+        urls = [real_server.make_url(f"/flaky/{i}") for i in range(5)]
+
+        # act
+        output_responses = await biar.request_many(
+            urls=urls,
+            config=biar.RequestConfig(
+                retryer=biar.Retryer(attempts=2, max_delay=0),
+            ),
+        )
+
+        # assert
+        assert [response.json_content for response in output_responses] == [
+            {"key": str(i)} for i in range(5)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_request_keeps_cookies_across_redirects(
+        self, real_server: TestServer
+    ):
+        # arrange
+        # aiohttp only stores cookies for domain names, not ip addresses
+        url = real_server.make_url("/login").with_host("localhost")
+
+        # act
+        output_response = await biar.request(url=url)
+
+        # assert
+        assert output_response.json_content == {"sid": "abc"}
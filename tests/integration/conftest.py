@@ -0,0 +1,39 @@
+from typing import AsyncIterator, Set
+
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+
+async def _entity_handler(request: web.Request) -> web.Response:
+    return web.json_response({"key": request.match_info["key"]})
+
+
+async def _login_handler(request: web.Request) -> web.Response:
+    raise web.HTTPFound("/me", headers={"Set-Cookie": "sid=abc"})
+
+
+async def _me_handler(request: web.Request) -> web.Response:
+    return web.json_response({"sid": request.cookies.get("sid")})
+
+
+@pytest_asyncio.fixture
+async def real_server() -> AsyncIterator[TestServer]:
+    """Local http server, exercising the whole client stack (no mocked session)."""
+    failed_keys: Set[str] = set()
+
+    async def flaky_handler(request: web.Request) -> web.Response:
+        # fails the first request made for each key, then succeeds
+        key = request.match_info["key"]
+        if key not in failed_keys:
+            failed_keys.add(key)
+            return web.Response(status=500, text="Server Error")
+        return web.json_response({"key": key})
+
+    app = web.Application()
+    app.router.add_get("/entity/{key}", _entity_handler)
+    app.router.add_get("/flaky/{key}", flaky_handler)
+    app.router.add_get("/login", _login_handler)
+    app.router.add_get("/me", _me_handler)
+    async with TestServer(app, host="127.0.0.1") as server:
+        yield server
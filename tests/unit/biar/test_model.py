@@ -0,0 +1,99 @@
+import pytest
+from pydantic import ValidationError
+
+import biar
+
+
+class TestRequestConfig:
+    def test_static_request_kwargs_refreshed_on_changes(self):
+        # arrange
+        config = biar.RequestConfig(method="GET")
+        _ = config._static_request_kwargs
+
+        # act
+        copied_config = config.model_copy(update=dict(method="POST"))
+        config.method = "PUT"
+
+        # assert
+        assert copied_config._static_request_kwargs["method"] == "POST"
+        assert config._static_request_kwargs["method"] == "PUT"
+
+    def test_static_request_kwargs_timeout(self):
+        # act
+        config = biar.RequestConfig(timeout=60, connect_timeout=5)
+
+        # assert
+        assert config._static_request_kwargs["timeout"].total == 60
+        assert config._static_request_kwargs["timeout"].connect == 5
+
+    def test_authorization_header_refreshed_on_changes(self):
+        # arrange
+        config = biar.RequestConfig(bearer_token="token")
+        _ = config._authorization_header
+
+        # act
+        config.bearer_token = "new-token"
+
+        # assert
+        assert config._authorization_header == "Bearer new-token"
+        assert biar.RequestConfig()._authorization_header is None
+
+    @pytest.mark.parametrize("max_concurrency", [0, -1])
+    def test_max_concurrency_must_be_positive(self, max_concurrency: int):
+        # act and assert
+        with pytest.raises(ValidationError):
+            biar.RequestConfig(max_concurrency=max_concurrency)
+
+    def test_acceptable_codes_as_frozenset(self):
+        # act
+        config = biar.RequestConfig(acceptable_codes=[200, 201, 201])
+
+        # assert
+        assert config.acceptable_codes == frozenset({200, 201})
+
+
+class TestRetryer:
+    def test_retry_exceptions_refreshed_on_changes(self):
+        # arrange
+        retryer = biar.Retryer()
+        _ = retryer.retry_exceptions
+
+        # act
+        retryer.retry_if_exception_in = (ValueError,)
+
+        # assert
+        assert retryer.retry_exceptions == (
+            ValueError,
+            biar.ResponseEvaluationError,
+        )
+
+    def test_get_delay_exponential(self):
+        # arrange
+        retryer = biar.Retryer(min_delay=1, max_delay=5, jitter=False)
+
+        # act
+        delays = [retryer.get_delay(attempt=attempt) for attempt in range(1, 6)]
+
+        # assert
+        assert delays == [1, 2, 4, 5, 5]
+
+    def test_get_delay_fixed(self):
+        # arrange
+        retryer = biar.Retryer(min_delay=2, backoff="fixed", jitter=False)
+
+        # act
+        delays = [retryer.get_delay(attempt=attempt) for attempt in range(1, 4)]
+
+        # assert
+        assert delays == [2, 2, 2]
+
+    def test_get_delay_jitter(self):
+        # arrange
+        retryer = biar.Retryer(min_delay=4, max_delay=5, backoff="fixed")
+
+        # act
+        delays = [retryer.get_delay(attempt=1) for _ in range(100)]
+
+        # assert
+        assert all(2 <= delay <= 5 for delay in delays)
+        assert len(set(delays)) > 1
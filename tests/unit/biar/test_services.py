@@ -1,14 +1,23 @@
+import asyncio
 import datetime
+import gc
+import json
 import ssl
-from asyncio import AbstractEventLoop, gather
-from typing import List
+import sys
+import threading
+import time
+import warnings
+from asyncio import AbstractEventLoop, gather, sleep
+from typing import List, Optional
 from unittest.mock import AsyncMock, patch
 
 import aiodns
+import aiohttp
 import pytest
 from aiohttp.http_exceptions import HttpProcessingError
 from aioresponses import CallbackResult, aioresponses
-from pydantic import BaseModel
+from multidict import CIMultiDict
+from pydantic import BaseModel, RootModel
 from yarl import URL
 
 import biar
@@ -17,6 +26,10 @@ import biar.errors
 BASE_URL = "https://api.com/v1"
 
 
+class MyModel(BaseModel):
+    key: str
+
+
 @pytest.fixture
 def mock_server() -> aioresponses:
     with aioresponses() as m:
@@ -27,17 +40,14 @@ class TestRequest:
     @pytest.mark.asyncio
     async def test_request_structured_many(self, mock_server: aioresponses):
         # arrange
-        class MyModel(BaseModel):
-            key: str
-
         headers = {"Content-Type": "application/json"}
         response_json_content = {"key": "value"}
-        for i in range(2):
-            mock_server.get(
-                url=URL(BASE_URL),
-                headers=headers,
-                payload=response_json_content,
-            )
+        mock_server.get(
+            url=URL(BASE_URL),
+            headers=headers,
+            payload=response_json_content,
+            repeat=True,
+        )
         target_response = [
             biar.model.StructuredResponse(
                 url=URL(BASE_URL),
@@ -58,16 +68,125 @@ class TestRequest:
         # assert
         assert target_response == output_response
 
+    @pytest.mark.asyncio
+    async def test_request_structured_iter(self, mock_server: aioresponses):
+        # arrange
+        async def slow_callback(url: URL, **kwargs):
+            await sleep(0.1)
+            return CallbackResult(status=200, payload={"key": "slow"})
+
+        mock_server.get(url=f"{BASE_URL}/slow", callback=slow_callback)
+        mock_server.get(url=f"{BASE_URL}/fast", payload={"key": "fast"})
+
+        # act
+        output = [
+            response.structured_content
+            async for response in biar.request_structured_iter(
+                model=MyModel, urls=[f"{BASE_URL}/slow", f"{BASE_URL}/fast"]
+            )
+        ]
+
+        # assert
+        assert output == [MyModel(key="fast"), MyModel(key="slow")]
+
+    @pytest.mark.asyncio
+    async def test_request_structured_iter_stop_early(self, mock_server: aioresponses):
+        # arrange
+        completed = []
+
+        async def slow_callback(url: URL, **kwargs):
+            await sleep(0.1)
+            completed.append(url)
+            return CallbackResult(status=200, payload={"key": "slow"})
+
+        mock_server.get(url=f"{BASE_URL}/slow", callback=slow_callback)
+        mock_server.get(url=f"{BASE_URL}/fast", payload={"key": "fast"})
+        responses = biar.request_structured_iter(
+            model=MyModel, urls=[f"{BASE_URL}/slow", f"{BASE_URL}/fast"]
+        )
+
+        # act
+        async for response in responses:
+            break
+        await responses.aclose()
+        await sleep(0.2)
+
+        # assert
+        assert response.structured_content == MyModel(key="fast")
+        assert completed == []
+
+    @pytest.mark.asyncio
+    async def test_request_structured_iter_creates_requests_lazily(
+        self, mock_server: aioresponses
+    ):
+        # arrange
+        async def slow_callback(url: URL, **kwargs):
+            await sleep(0.01)
+            return CallbackResult(status=200, payload={"key": "value"})
+
+        mock_server.get(url=BASE_URL, callback=slow_callback, repeat=True)
+        responses = biar.request_structured_iter(
+            model=MyModel,
+            urls=[BASE_URL] * 5,
+            config=biar.RequestConfig(max_concurrency=1),
+        )
+
+        # act
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter("always")
+            async for response in responses:
+                break
+            await responses.aclose()
+            await sleep(0.05)
+            gc.collect()
+
+        # assert
+        assert response.structured_content == MyModel(key="value")
+        assert not [w for w in caught_warnings if w.category is RuntimeWarning]
+
+    @pytest.mark.asyncio
+    async def test_request_structured_iter_error(self, mock_server: aioresponses):
+        # arrange
+        mock_server.get(url=f"{BASE_URL}/ok", payload={"key": "ok"}, repeat=True)
+        mock_server.get(url=f"{BASE_URL}/error", status=500, repeat=True)
+
+        # act and assert
+        with pytest.raises(biar.errors.ResponseEvaluationError):
+            async for _ in biar.request_structured_iter(
+                model=MyModel,
+                urls=[f"{BASE_URL}/ok", f"{BASE_URL}/error"],
+                config=biar.RequestConfig(retryer=biar.Retryer(attempts=1)),
+            ):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_request_structured_list_content(self, mock_server: aioresponses):
+        # arrange
+        mock_server.get(url=BASE_URL, payload=[{"key": "1"}, {"key": "2"}])
+
+        # act
+        output_response = await biar.request_structured(
+            model=RootModel[List[MyModel]],
+            url=BASE_URL,
+        )
+
+        # assert
+        assert output_response.json_content == [{"key": "1"}, {"key": "2"}]
+        assert output_response.structured_content.root == [
+            MyModel(key="1"),
+            MyModel(key="2"),
+        ]
+
     @pytest.mark.asyncio
     async def test_request_many_payload(self, mock_server: aioresponses):
         # arrange
         def callback(url: URL, **kwargs):
-            if url == URL(BASE_URL) / "1" and kwargs["json"] == {
+            if url == URL(BASE_URL) / "1" and json.loads(kwargs["data"]) == {
                 "key": "1",
                 "ts": "2023-01-01T00:00:00",
             }:
                 return CallbackResult(status=200)
-            elif url == URL(BASE_URL) / "2" and kwargs["json"] == {
+            elif url == URL(BASE_URL) / "2" and json.loads(kwargs["data"]) == {
                 "key": "2",
                 "ts": "2023-01-02T00:00:00",
             }:
@@ -102,6 +221,186 @@ class TestRequest:
         # assert
         assert all([response.status_code == 200 for response in output_responses])
 
+    @pytest.mark.asyncio
+    async def test_request_many_shared_session(self, mock_server: aioresponses):
+        # arrange
+        mock_server.get(url=BASE_URL, status=200, repeat=True)
+
+        # act
+        with patch("aiohttp.ClientSession", wraps=aiohttp.ClientSession) as mock:
+            output_responses = await biar.request_many(urls=[BASE_URL] * 3)
+
+        # assert
+        assert all([response.status_code == 200 for response in output_responses])
+        mock.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "max_concurrency, expected_max_in_flight", [(2, 2), (None, 4)]
+    )
+    async def test_request_many_max_concurrency(
+        self,
+        mock_server: aioresponses,
+        max_concurrency: Optional[int],
+        expected_max_in_flight: int,
+    ):
+        # arrange
+        in_flight = []
+        max_in_flight = []
+
+        async def callback(url: URL, **kwargs):
+            in_flight.append(url)
+            max_in_flight.append(len(in_flight))
+            await sleep(0.01)
+            in_flight.remove(url)
+            return CallbackResult(status=200)
+
+        for i in range(4):
+            mock_server.get(url=URL(BASE_URL) / str(i), callback=callback)
+
+        # act
+        output_responses = await biar.request_many(
+            urls=[URL(BASE_URL) / str(i) for i in range(4)],
+            config=biar.RequestConfig(max_concurrency=max_concurrency),
+        )
+
+        # assert
+        assert all([response.status_code == 200 for response in output_responses])
+        assert max(max_in_flight) == expected_max_in_flight
+
+    @pytest.mark.asyncio
+    async def test_request_many_error(self, mock_server: aioresponses):
+        # arrange
+        mock_server.get(url=URL(BASE_URL) / "ok", status=200)
+        mock_server.get(url=URL(BASE_URL) / "error", status=500)
+
+        # act and assert
+        with pytest.raises(biar.ResponseEvaluationError):
+            _ = await biar.request_many(
+                urls=[URL(BASE_URL) / "ok", URL(BASE_URL) / "error"],
+                config=biar.RequestConfig(retryer=biar.Retryer(attempts=1)),
+            )
+
+    @pytest.mark.asyncio
+    async def test_request_any_content_payload(self, mock_server: aioresponses):
+        # arrange
+        def callback(url: URL, **kwargs):
+            if kwargs["data"] == "raw content":
+                return CallbackResult(status=200)
+            return CallbackResult(status=500)
+
+        mock_server.post(url=BASE_URL, callback=callback)
+
+        # act
+        output_response = await biar.request(
+            url=BASE_URL,
+            config=biar.RequestConfig(method="POST"),
+            payload=biar.Payload(content_type="text/plain", any_content="raw content"),
+        )
+
+        # assert
+        assert output_response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_request_headers_changed_in_place(self, mock_server: aioresponses):
+        # arrange
+        sent_headers = []
+
+        def callback(url: URL, **kwargs):
+            sent_headers.append(kwargs["headers"])
+            return CallbackResult(status=200)
+
+        mock_server.get(url=BASE_URL, callback=callback, repeat=True)
+        config = biar.RequestConfig(
+            headers={"key": "value"}, bearer_token="token", use_random_user_agent=False
+        )
+
+        # act
+        _ = await biar.request(url=BASE_URL, config=config)
+        config.headers["key"] = "new value"
+        _ = await biar.request(url=BASE_URL, config=config)
+
+        # assert
+        assert sent_headers == [
+            {"key": "value", "Authorization": "Bearer token"},
+            {"key": "new value", "Authorization": "Bearer token"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_request_payload_serialized_per_request(
+        self, mock_server: aioresponses
+    ):
+        # arrange
+        sent_data = []
+
+        def callback(url: URL, **kwargs):
+            sent_data.append(kwargs["data"])
+            return CallbackResult(status=200)
+
+        mock_server.post(url=BASE_URL, callback=callback, repeat=True)
+        content = MyModel(key="value")
+        payload = biar.Payload(structured_content=content)
+        config = biar.RequestConfig(method="POST")
+
+        # act
+        _ = await biar.request(url=BASE_URL, config=config, payload=payload)
+        content.key = "new value"
+        _ = await biar.request(url=BASE_URL, config=config, payload=payload)
+
+        # assert
+        assert sent_data == ['{"key":"value"}', '{"key":"new value"}']
+
+    @pytest.mark.asyncio
+    async def test_request_many_payload_serialized_once(
+        self, mock_server: aioresponses
+    ):
+        # arrange
+        sent_data = []
+
+        def callback(url: URL, **kwargs):
+            sent_data.append(kwargs["data"])
+            return CallbackResult(status=200)
+
+        mock_server.post(url=BASE_URL, callback=callback, repeat=True)
+        payload = biar.Payload(structured_content=MyModel(key="value"))
+
+        # act
+        with patch.object(
+            MyModel, "model_dump_json", return_value='{"key":"value"}'
+        ) as mock:
+            _ = await biar.request_many(
+                urls=[BASE_URL] * 3,
+                config=biar.RequestConfig(method="POST"),
+                payloads=[payload] * 3,
+            )
+
+        # assert
+        assert sent_data == ['{"key":"value"}'] * 3
+        mock.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_request_proxy(self, mock_server: aioresponses):
+        # arrange
+        def callback(url: URL, **kwargs):
+            if kwargs["proxy"] == "http://proxy.com" and isinstance(
+                kwargs["ssl_context"], ssl.SSLContext
+            ):
+                return CallbackResult(status=200)
+            return CallbackResult(status=500)
+
+        mock_server.get(url=BASE_URL, callback=callback)
+
+        # act
+        output_response = await biar.request(
+            url=BASE_URL,
+            config=biar.RequestConfig(
+                proxy_config=biar.ProxyConfig(host="http://proxy.com")
+            ),
+        )
+
+        # assert
+        assert output_response.status_code == 200
+
     @pytest.mark.asyncio
     async def test_request_retry_success(self, mock_server: aioresponses):
         # arrange
@@ -111,7 +410,7 @@ class TestRequest:
         mock_server.get(url=BASE_URL, status=200)
 
         # act
-        start_ts = datetime.datetime.now(datetime.UTC)
+        start_ts = time.perf_counter()
         output_response = await biar.request(
             url=BASE_URL,
             config=biar.RequestConfig(
@@ -121,11 +420,12 @@ class TestRequest:
                     attempts=2,
                     min_delay=1,
                     max_delay=1,
+                    jitter=False,
                 ),
             ),
         )
-        end_ts = datetime.datetime.now(datetime.UTC)
-        elapsed_time = (end_ts - start_ts).total_seconds()
+        end_ts = time.perf_counter()
+        elapsed_time = end_ts - start_ts
 
         # assert
         assert output_response.status_code == 200
@@ -152,9 +452,7 @@ class TestRequest:
     @pytest.mark.asyncio
     async def test_request_retry_status_fail(self, mock_server: aioresponses):
         # arrange
-        mock_server.get(url=BASE_URL, status=500)
-        mock_server.get(url=BASE_URL, status=500)
-        mock_server.get(url=BASE_URL, status=500)
+        mock_server.get(url=BASE_URL, status=500, repeat=True)
         retrier = biar.model.Retryer(attempts=2, max_delay=0)
 
         # act and assert
@@ -167,18 +465,150 @@ class TestRequest:
                 ),
             )
 
+    @pytest.mark.asyncio
+    async def test_request_status_fail_message(self, mock_server: aioresponses):
+        # arrange
+        mock_server.get(
+            url=BASE_URL, status=500, body='{"detail": "error"}', repeat=True
+        )
+        retrier = biar.model.Retryer(attempts=2, max_delay=0)
+
+        # act and assert
+        with pytest.raises(biar.errors.ResponseEvaluationError) as error:
+            _ = await biar.request(
+                url=BASE_URL,
+                config=biar.RequestConfig(
+                    method="GET",
+                    download_text_content=False,
+                    retryer=retrier,
+                ),
+            )
+        assert str(error.value) == (
+            'Error: status=500, Text content: {"detail": "error"}'
+        )
+
+    @pytest.mark.asyncio
+    async def test_request_head(self, mock_server: aioresponses):
+        # arrange
+        mock_server.head(url=BASE_URL, status=200, headers={"key": "value"})
+
+        # act
+        output_response = await biar.request(
+            url=BASE_URL,
+            config=biar.RequestConfig(
+                method="HEAD",
+                download_json_content=False,
+                download_text_content=False,
+            ),
+        )
+
+        # assert
+        assert output_response.status_code == 200
+        assert output_response.headers["key"] == "value"
+
+    @pytest.mark.asyncio
+    async def test_request_repeated_headers_keep_last(self, mock_server: aioresponses):
+        # arrange
+        mock_server.get(
+            url=BASE_URL,
+            status=200,
+            headers=CIMultiDict([("Set-Cookie", "a=1"), ("Set-Cookie", "b=2")]),
+        )
+
+        # act
+        output_response = await biar.request(url=BASE_URL)
+
+        # assert
+        assert output_response.headers["Set-Cookie"] == "b=2"
+        assert output_response.json_content is None
+
+    @pytest.mark.asyncio
+    async def test_request_stream(self, mock_server: aioresponses):
+        # arrange
+        mock_server.get(url=BASE_URL, status=200, body=b"0123456789")
+
+        # act
+        chunks = [
+            chunk async for chunk in biar.request_stream(url=BASE_URL, chunk_size=4)
+        ]
+
+        # assert
+        assert chunks == [b"0123", b"4567", b"89"]
+
+    @pytest.mark.asyncio
+    async def test_request_stream_status_fail(self, mock_server: aioresponses):
+        # arrange
+        mock_server.get(url=BASE_URL, status=500, body="Server Error")
+
+        # act and assert
+        with pytest.raises(biar.ResponseEvaluationError):
+            _ = [chunk async for chunk in biar.request_stream(url=BASE_URL)]
+
+    @pytest.mark.asyncio
+    async def test_request_acceptable_codes(self, mock_server: aioresponses):
+        # arrange
+        mock_server.get(url=BASE_URL, status=201)
+
+        # act
+        output_response = await biar.request(
+            url=BASE_URL,
+            config=biar.RequestConfig(acceptable_codes=[200, 201]),
+        )
+
+        # assert
+        assert output_response.status_code == 201
+
     def test_request_rate_limit(
         self, event_loop: AbstractEventLoop, mock_server: aioresponses
     ):
         # arrange
-        mock_server.get(url=BASE_URL, status=200)
-        mock_server.get(url=BASE_URL, status=200)
-        mock_server.get(url=BASE_URL, status=200)
+        mock_server.get(url=BASE_URL, status=200, repeat=True)
         rate_limiter = biar.model.RateLimiter(rate=2, time_frame=1, identity="api")
         config = biar.RequestConfig(
             method="GET",
             rate_limiter=rate_limiter,
         )
+        async_requests = [biar.request(url=BASE_URL, config=config) for _ in range(5)]
+
+        # act
+        start_ts = time.perf_counter()
+        _ = event_loop.run_until_complete(gather(*async_requests))
+        end_ts = time.perf_counter()
+        elapsed_time = end_ts - start_ts
+
+        # assert
+        assert 1 < elapsed_time < 2
+
+    def test_request_rate_limit_capacity(
+        self, event_loop: AbstractEventLoop, mock_server: aioresponses
+    ):
+        # arrange
+        mock_server.get(url=BASE_URL, status=200, repeat=True)
+        rate_limiter = biar.model.RateLimiter(rate=4, time_frame=1, capacity=1)
+        config = biar.RequestConfig(method="GET", rate_limiter=rate_limiter)
+        async_requests = [biar.request(url=BASE_URL, config=config) for _ in range(3)]
+
+        # act
+        start_ts = time.perf_counter()
+        _ = event_loop.run_until_complete(gather(*async_requests))
+        end_ts = time.perf_counter()
+        elapsed_time = end_ts - start_ts
+
+        # assert
+        assert 0.5 <= elapsed_time < 1
+
+    def test_request_rate_limit_sliding_window(
+        self, event_loop: AbstractEventLoop, mock_server: aioresponses
+    ):
+        # arrange
+        mock_server.get(url=BASE_URL, status=200, repeat=True)
+        rate_limiter = biar.model.RateLimiter(
+            rate=2, time_frame=1, identity="api", strategy="sliding_window"
+        )
+        config = biar.RequestConfig(
+            method="GET",
+            rate_limiter=rate_limiter,
+        )
         async_requests = [
             biar.request(url=BASE_URL, config=config),
             biar.request(url=BASE_URL, config=config),
@@ -186,20 +616,16 @@ class TestRequest:
         ]
 
         # act
-        start_ts = datetime.datetime.now(datetime.UTC)
+        start_ts = time.perf_counter()
         _ = event_loop.run_until_complete(gather(*async_requests))
-        end_ts = datetime.datetime.now(datetime.UTC)
-        elapsed_time = (end_ts - start_ts).total_seconds()
+        end_ts = time.perf_counter()
+        elapsed_time = end_ts - start_ts
 
         # assert
         assert 1 < elapsed_time < 2
 
     @pytest.mark.asyncio
     async def test_request_structured_many_value_error(self):
-        # arrange
-        class MyModel(BaseModel):
-            key: str
-
         # act and assert
         with pytest.raises(ValueError):
             _ = await biar.request_structured_many(
@@ -267,9 +693,9 @@ class TestRequest:
         class MyModel(BaseModel):
             status: str
 
-        mock_server.get(url=BASE_URL, status=200, payload={"status": "pending"})
-        mock_server.get(url=BASE_URL, status=200, payload={"status": "pending"})
-        mock_server.get(url=BASE_URL, status=200, payload={"status": "pending"})
+        mock_server.get(
+            url=BASE_URL, status=200, payload={"status": "pending"}, repeat=True
+        )
 
         # act and assert
         with pytest.raises(biar.errors.PollError):
@@ -284,6 +710,65 @@ class TestRequest:
             )
 
 
+class TestSession:
+    @pytest.mark.asyncio
+    async def test_session_pool_sizes(self, mock_server: aioresponses):
+        # arrange
+        mock_server.get(url=BASE_URL, status=200, repeat=True)
+
+        # act
+        with patch(
+            "aiohttp.TCPConnector", wraps=aiohttp.TCPConnector
+        ) as mock_connector:
+            _ = await biar.request(
+                url=BASE_URL,
+                config=biar.RequestConfig(pool_size=10, pool_size_per_host=5),
+            )
+
+        # assert
+        _, kwargs = mock_connector.call_args
+        assert kwargs["limit"] == 10
+        assert kwargs["limit_per_host"] == 5
+
+    @pytest.mark.asyncio
+    async def test_user_session_not_closed(self, mock_server: aioresponses):
+        # arrange
+        mock_server.get(url=BASE_URL, status=200, repeat=True)
+
+        # act
+        async with aiohttp.ClientSession() as session:
+            config = biar.RequestConfig(session=session)
+            _ = await biar.request(url=BASE_URL, config=config)
+            _ = await biar.request_many(urls=[BASE_URL] * 2, config=config)
+
+            # assert
+            assert not session.closed
+
+    def test_sessions_closed_between_event_loops(self):
+        # arrange
+        sessions: List[aiohttp.ClientSession] = []
+        client_session = aiohttp.ClientSession
+
+        def new_session(*args, **kwargs) -> aiohttp.ClientSession:
+            session = client_session(*args, **kwargs)
+            sessions.append(session)
+            return session
+
+        # act
+        with aioresponses() as m, patch(
+            "aiohttp.ClientSession", side_effect=new_session
+        ):
+            m.get(url=BASE_URL, status=200, repeat=True)
+            for _ in range(5):
+                loop = asyncio.new_event_loop()
+                loop.run_until_complete(biar.request(url=BASE_URL))
+                loop.close()
+
+        # assert
+        assert len(sessions) == 5
+        assert all(session.closed for session in sessions)
+
+
 def test_get_ssl_context():
     # arrange
     extra_certificate = """
@@ -310,7 +795,67 @@ nxS2PFOiTAZpffpskcYqSUXm7LcT4Tps
     isinstance(ssl_context, ssl.SSLContext)
 
 
+def test_get_ssl_context_cached():
+    # act
+    first_ssl_context = biar.get_ssl_context()
+    second_ssl_context = biar.get_ssl_context()
+
+    # assert
+    assert first_ssl_context is second_ssl_context
+
+
+@pytest.mark.asyncio
+async def test_get_ssl_context_async():
+    # act
+    async_ssl_context = await biar.get_ssl_context_async()
+
+    # assert
+    assert async_ssl_context is biar.get_ssl_context()
+
+
+def test_get_ssl_context_cache_size():
+    # arrange
+    with patch.object(biar.services, "_SSL_CONTEXTS_CACHE_SIZE", new=1), patch.dict(
+        biar.services._ssl_contexts, clear=True
+    ), patch.object(
+        biar.services,
+        "_build_ssl_context",
+        side_effect=lambda extra_certificate: object(),
+    ):
+        # act
+        first_ssl_context = biar.get_ssl_context(extra_certificate="first")
+        _ = biar.get_ssl_context(extra_certificate="second")
+
+        # assert
+        assert list(biar.services._ssl_contexts) == ["second"]
+        assert biar.get_ssl_context(extra_certificate="first") is not first_ssl_context
+
+
+@pytest.mark.asyncio
+async def test_get_ssl_context_async_dedicated_executor():
+    # arrange
+    thread_names = []
+
+    def build_ssl_context(extra_certificate):
+        thread_names.append(threading.current_thread().name)
+        return object()
+
+    # act
+    with patch.dict(biar.services._ssl_contexts, clear=True), patch.object(
+        biar.services, "_build_ssl_context", side_effect=build_ssl_context
+    ):
+        _ = await biar.get_ssl_context_async(extra_certificate="extra")
+
+    # assert
+    assert len(thread_names) == 1
+    assert thread_names[0].startswith("biar-ssl")
+
+
 class TestIsHostReachableService:
+    @pytest.fixture(autouse=True)
+    def clear_dns_cache(self):
+        biar.services._dns_cache.clear()
+
     @pytest.mark.asyncio
     async def test_is_host_reachable(self):
         # act
@@ -321,6 +866,17 @@ class TestIsHostReachableService:
         assert output is True
         mock.assert_called_once_with("google.com", qtype="A")
 
+    @pytest.mark.asyncio
+    async def test_is_host_reachable_cached(self):
+        # act
+        with patch("aiodns.DNSResolver.query", new=AsyncMock()) as mock:
+            first_output = await biar.is_host_reachable(host="google.com")
+            second_output = await biar.is_host_reachable(host="google.com")
+
+        # assert
+        assert first_output is second_output is True
+        mock.assert_called_once_with("google.com", qtype="A")
+
     @pytest.mark.asyncio
     async def test_is_host_reachable_error(self):
         # arrange
@@ -334,3 +890,93 @@ class TestIsHostReachableService:
         # assert
         assert output is False
         assert "google.com" in mock.mock_calls[0].args
+
+    @pytest.mark.asyncio
+    async def test_is_host_reachable_reuses_resolver(self):
+        # act
+        with patch("aiodns.DNSResolver.query", new=AsyncMock()):
+            _ = await biar.is_host_reachable(host="google.com")
+            first_resolver = biar.services._dns_resolver
+            _ = await biar.is_host_reachable(host="github.com")
+
+        # assert
+        assert biar.services._dns_resolver is first_resolver
+
+    def test_is_host_reachable_resolver_replaced_in_new_loop(self):
+        # arrange
+        resolvers = []
+
+        async def check_host():
+            _ = await biar.is_host_reachable(host="google.com")
+            resolvers.append(biar.services._dns_resolver)
+            biar.services._dns_cache.clear()
+
+        # act
+        with patch("aiodns.DNSResolver.query", new=AsyncMock()):
+            for _ in range(2):
+                loop = asyncio.new_event_loop()
+                loop.run_until_complete(check_host())
+                loop.close()
+
+        # assert
+        assert resolvers[0] is not resolvers[1]
+
+    @pytest.mark.asyncio
+    async def test_is_host_reachable_cache_evicts_expired(self):
+        # arrange
+        biar.services._dns_cache["old.com"] = (time.monotonic() - 61, True)
+
+        # act
+        with patch("aiodns.DNSResolver.query", new=AsyncMock()):
+            _ = await biar.is_host_reachable(host="google.com")
+
+        # assert
+        assert list(biar.services._dns_cache) == ["google.com"]
+
+    @pytest.mark.asyncio
+    async def test_is_host_reachable_cache_size(self):
+        # act
+        with patch("biar.services._DNS_CACHE_SIZE", new=2), patch(
+            "aiodns.DNSResolver.query", new=AsyncMock()
+        ):
+            for host in ["a.com", "b.com", "c.com"]:
+                _ = await biar.is_host_reachable(host=host)
+
+        # assert
+        assert list(biar.services._dns_cache) == ["b.com", "c.com"]
+
+
+class TestInstallUvloop:
+    def test_install_uvloop(self):
+        # arrange
+        uvloop = pytest.importorskip("uvloop")
+
+        # act
+        with patch("asyncio.set_event_loop_policy") as mock:
+            output = biar.install_uvloop()
+
+        # assert
+        assert output is True
+        assert isinstance(mock.call_args.args[0], uvloop.EventLoopPolicy)
+
+    @pytest.mark.asyncio
+    async def test_tests_run_on_uvloop(self):
+        # arrange
+        uvloop = pytest.importorskip("uvloop")
+
+        # act
+        loop = asyncio.get_running_loop()
+
+        # assert
+        assert isinstance(loop, uvloop.Loop)
+
+    def test_install_uvloop_not_available(self):
+        # act
+        with patch.dict(sys.modules, {"uvloop": None}), patch(
+            "asyncio.set_event_loop_policy"
+        ) as mock:
+            output = biar.install_uvloop()
+
+        # assert
+        assert output is False
+        mock.assert_not_called()